@@ -234,7 +234,9 @@ def check_pv_net_cf():
     """
 
     import math
-    res = sum(list(net_cf(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    result = np.fromiter((net_cf(t) for t in range(proj_len())),
+                         dtype=np.float64, count=proj_len())
+    res = result @ disc_factors()[:proj_len()]
 
     return math.isclose(res, pv_net_cf())
 
@@ -303,7 +305,8 @@ def disc_rate_mth():
         :func:`disc_rate_ann`
 
     """
-    return np.array(list((1 + disc_rate_ann[t//12])**(1/12) - 1 for t in range(proj_len())))
+    rates = disc_rate_ann.to_numpy(dtype=np.float64)
+    return np.array(list((1 + rates[t//12])**(1/12) - 1 for t in range(proj_len())))
 
 
 def duration(t):
@@ -365,7 +368,7 @@ def inflation_factor(t):
         * :func:`inflation_rate`
 
     """
-    return (1 + inflation_rate)**(t//12)
+    return (1 + inflation_rate())**(t//12)
 
 
 def inflation_rate():
@@ -629,7 +632,9 @@ def pv_claims():
         * :func:`claims`
 
     """
-    return sum(list(claims(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    result = np.fromiter((claims(t) for t in range(proj_len())),
+                         dtype=np.float64, count=proj_len())
+    return result @ disc_factors()[:proj_len()]
 
 
 def pv_commissions():
@@ -640,7 +645,9 @@ def pv_commissions():
         * :func:`expenses`
 
     """
-    return sum(list(commissions(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    result = np.fromiter((commissions(t) for t in range(proj_len())),
+                         dtype=np.float64, count=proj_len())
+    return result @ disc_factors()[:proj_len()]
 
 
 def pv_expenses():
@@ -651,7 +658,9 @@ def pv_expenses():
         * :func:`expenses`
 
     """
-    return sum(list(expenses(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    result = np.fromiter((expenses(t) for t in range(proj_len())),
+                         dtype=np.float64, count=proj_len())
+    return result @ disc_factors()[:proj_len()]
 
 
 def pv_net_cf():
@@ -680,7 +689,9 @@ def pv_pols_if():
     It is used as the annuity factor for calculating :func:`net_premium_pp`.
 
     """
-    return sum(list(pols_if(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    result = np.fromiter((pols_if(t) for t in range(proj_len())),
+                         dtype=np.float64, count=proj_len())
+    return result @ disc_factors()[:proj_len()]
 
 
 def pv_premiums():
@@ -691,7 +702,9 @@ def pv_premiums():
         * :func:`premiums`
 
     """
-    return sum(list(premiums(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    result = np.fromiter((premiums(t) for t in range(proj_len())),
+                         dtype=np.float64, count=proj_len())
+    return result @ disc_factors()[:proj_len()]
 
 
 def result_cf():
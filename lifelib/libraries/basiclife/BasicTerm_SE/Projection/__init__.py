@@ -195,6 +195,24 @@ Attributes:
            * :func:`mort_rate`
            * :func:`mort_rate_mth`
 
+    pv_cache_dir: The directory to save the present values in.
+        ``None`` by default.
+        When a path is set, :func:`present_values` saves the present values
+        of each model point in the directory, and reads them from
+        the directory when they are calculated again,
+        for example in another session, with the same
+        model point and assumptions.
+        See :func:`assumptions_hash` for the assumptions
+        that the saved values are keyed by.
+        Since all the ``pv_`` Cells and :func:`check_pv_net_cf`
+        read their values from :func:`present_values`,
+        they are not recalculated either.
+        `joblib`_ needs to be installed to set a path.
+
+    BEF_MAT: Integer code 0 for the ``timing`` of :func:`pols_if_at`
+    BEF_NB: Integer code 1 for the ``timing`` of :func:`pols_if_at`
+    BEF_DECR: Integer code 2 for the ``timing`` of :func:`pols_if_at`
+
     np: The `numpy`_ module.
     pd: The `pandas`_ module.
 
@@ -204,6 +222,9 @@ Attributes:
 .. _pandas:
    https://pandas.pydata.org/
 
+.. _joblib:
+   https://joblib.readthedocs.io/
+
 .. _new_pandas:
    https://docs.modelx.io/en/latest/reference/space/generated/modelx.core.space.UserSpace.new_pandas.html
 
@@ -247,6 +268,85 @@ def age_at_entry():
     return model_point()["age_at_entry"]
 
 
+def assumptions_hash():
+    """Hash of the assumptions
+
+    A hex digest of the MD5 hash of :attr:`mort_table`,
+    :attr:`disc_rate_ann`, :attr:`premium_table`,
+    :func:`expense_acq`, :func:`expense_maint` and :func:`inflation_rate`.
+    The tables are hashed by the bytes of their values
+    and the lists of their labels, which takes about 0.1 milliseconds,
+    as :func:`assumptions_hash` is recalculated every time
+    :attr:`point_id` is changed.
+    :func:`present_values` uses the hash to name the files of
+    the present values saved in :attr:`pv_cache_dir`.
+
+    .. seealso::
+
+        * :func:`present_values`
+        * :attr:`pv_cache_dir`
+
+    """
+    import hashlib
+
+    result = hashlib.md5()
+    for table in (mort_table, disc_rate_ann, premium_table):
+        result.update(table.to_numpy(dtype=np.float64).tobytes())
+        result.update(repr(table.index.tolist()).encode())
+
+    result.update(repr((mort_table.columns.tolist(), expense_acq(),
+                        expense_maint(), inflation_rate())).encode())
+
+    return result.hexdigest()
+
+
+def cf_vectors():
+    """Cashflow vectors of the selected model point
+
+    Returns a dict of 1-D Numpy arrays of length :func:`proj_len`.
+    Each array holds the values from time 0 to :func:`proj_len` - 1
+    of the Cells indicated by its key,
+    and the Cells read their values at ``t`` from the arrays.
+    The Cells return 0 for ``t`` outside the projection,
+    i.e. for negative ``t`` and ``t`` of :func:`proj_len` or greater.
+    The keys are ``"premiums"``, ``"claims"``, ``"expenses"``,
+    ``"commissions"`` and ``"net_cf"``.
+
+    The cashflows are calculated for all ``t`` at once
+    from the arrays of :func:`pols_vectors` and :func:`timeline`.
+    The claims per policy are read from :func:`claim_pp` for each ``t``,
+    so that :func:`claim_pp` can be redefined.
+
+    .. seealso::
+
+        * :func:`premiums`
+        * :func:`claims`
+        * :func:`expenses`
+        * :func:`commissions`
+        * :func:`net_cf`
+
+    """
+    tl = timeline()
+    pols = pols_vectors()
+    bef_decr = pols["pols_if_at"][BEF_DECR]
+
+    prems = premium_pp() * bef_decr
+    claim_pp_arr = np.fromiter((claim_pp(t) for t in range(proj_len())),
+                               dtype=np.float64, count=proj_len())
+    claims_arr = claim_pp_arr * pols["pols_death"]
+    expenses_arr = expense_acq() * pols["pols_new_biz"] \
+        + bef_decr * expense_maint()/12 * tl["inflation_factor"]
+    comms = np.where(tl["duration"] == 0, prems, 0)
+
+    return {
+        "premiums": prems,
+        "claims": claims_arr,
+        "expenses": expenses_arr,
+        "commissions": comms,
+        "net_cf": prems - claims_arr - expenses_arr - comms
+    }
+
+
 def check_pv_net_cf():
     """Check present value summation
 
@@ -258,13 +358,12 @@ def check_pv_net_cf():
 
         * :func:`net_cf`
         * :func:`pv_net_cf`
+        * :func:`present_values`
 
     """
 
     import math
-    res = sum(list(net_cf(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
-
-    return math.isclose(res, pv_net_cf())
+    return math.isclose(present_values()["net_cf"], pv_net_cf())
 
 
 def claim_pp(t):
@@ -288,7 +387,10 @@ def claims(t):
         * :func:`pols_death`
 
     """
-    return claim_pp(t) * pols_death(t)
+    if 0 <= t < proj_len():
+        return cf_vectors()["claims"][t]
+    else:
+        return 0
 
 
 def commissions(t): 
@@ -302,20 +404,44 @@ def commissions(t):
         * :func:`duration`
 
     """
-    return premiums(t) if duration(t) == 0 else 0
+    if 0 <= t < proj_len():
+        return cf_vectors()["commissions"][t]
+    else:
+        return 0
 
 
 def disc_factors():
     """Discount factors.
 
     Vector of the discount factors as a Numpy array. Used for calculating
-    the present values of cashflows.
+    the present values of cashflows. Defined as::
+
+        (1 + disc_rate_mth())**(-t)
+
+    where ``t`` is the array of time from 0 to :func:`proj_len` - 1.
 
     .. seealso::
 
         :func:`disc_rate_mth`
     """
-    return np.array(list((1 + disc_rate_mth()[t])**(-t) for t in range(proj_len())))
+    return (1 + disc_rate_mth())**(-np.arange(proj_len()))
+
+
+def disc_rate_ann_array():
+    """Annual discount rates as a Numpy array
+
+    The values of :attr:`disc_rate_ann` as a float array.
+    The element at position ``i`` is the rate for the year ``i``,
+    so rates are picked up by position
+    instead of looking up :attr:`disc_rate_ann` by labels.
+
+    .. seealso::
+
+        * :attr:`disc_rate_ann`
+        * :func:`disc_rate_mth`
+
+    """
+    return disc_rate_ann.to_numpy(dtype=np.float64)
 
 
 def disc_rate_mth():
@@ -326,12 +452,18 @@ def disc_rate_mth():
 
         (1 + disc_rate_ann)**(1/12) - 1
 
+    The conversion is calculated as ``np.expm1(np.log1p(disc_rate_ann)/12)``,
+    which is more accurate than the power for small rates.
+
     .. seealso::
 
-        :func:`disc_rate_ann`
+        * :attr:`disc_rate_ann`
+        * :func:`disc_rate_ann_array`
 
     """
-    return np.array(list((1 + disc_rate_ann[t//12])**(1/12) - 1 for t in range(proj_len())))
+    disc_rate_mth_ann = np.expm1(
+        np.log1p(disc_rate_ann_array()[:proj_len()//12 + 1]) / 12)
+    return np.repeat(disc_rate_mth_ann, 12)[:proj_len()]
 
 
 def duration(t):
@@ -360,7 +492,7 @@ def duration_mth(t):
     if t == 0:
         return model_point()['duration_mth']
     else:
-        return duration_mth(t-1) + 1
+        return duration_mth(0) + t
 
 
 def expense_acq():
@@ -400,19 +532,53 @@ def expenses(t):
 
     """
 
-    return expense_acq() * pols_new_biz(t) \
-        + pols_if_at(t, "BEF_DECR") * expense_maint()/12 * inflation_factor(t)
+    if 0 <= t < proj_len():
+        return cf_vectors()["expenses"][t]
+    else:
+        return 0
 
 
 def inflation_factor(t):
     """The inflation factor at time t
 
+    The factor for the year of ``t``, read from
+    :func:`inflation_factor_array` as::
+
+        inflation_factor_array()[t//12]
+
+    ``t`` is from 0 to 12 times the length of :attr:`disc_rate_ann` minus 1.
+
     .. seealso::
 
+        * :func:`inflation_factor_array`
         * :func:`inflation_rate`
 
     """
-    return (1 + inflation_rate)**(t//12)
+    if t < 0:
+        raise ValueError("t must not be negative")
+
+    return inflation_factor_array()[t//12]
+
+
+def inflation_factor_array():
+    """Inflation factors by year as a 1-D Numpy array
+
+    The inflation factors for the years from 0 to
+    the last year in :attr:`disc_rate_ann` defined as::
+
+        (1 + inflation_rate())**year
+
+    :func:`inflation_factor`, :func:`timeline`,
+    :func:`result_pv_portfolio` and :func:`result_pv_scenarios`
+    pick up the factors from this array by the year of ``t``.
+
+    .. seealso::
+
+        * :func:`inflation_factor`
+        * :func:`inflation_rate`
+
+    """
+    return (1 + inflation_rate())**np.arange(len(disc_rate_ann))
 
 
 def inflation_rate():
@@ -423,16 +589,41 @@ def inflation_rate():
 def lapse_rate(t):
     """Lapse rate
 
+    The lapse rate for :func:`duration(t)<duration>` read from
+    :func:`lapse_rate_array`, which defines the lapse rate assumption.
+    Durations before issue are read as 0, and durations beyond
+    :func:`lapse_rate_array` as its last duration.
+
+    .. seealso::
+
+        * :func:`duration`
+        * :func:`lapse_rate_array`
+
+    """
+    return lapse_rate_array()[max(min(len(lapse_rate_array()) - 1,
+                                      duration(t)), 0)]
+
+
+def lapse_rate_array():
+    """Lapse rates by duration as a 1-D Numpy array
+
     By default, the lapse rate assumption is defined by duration as::
 
-        max(0.1 - 0.02 * duration(t), 0.02)
+        max(0.1 - 0.02 * duration, 0.02)
+
+    for the durations from 0 to the longest policy term
+    in :attr:`model_point_table`.
+    :func:`lapse_rate`, :func:`timeline` and :func:`portfolio_vectors`
+    pick up the rates from this array by duration,
+    so the lapse assumption is changed by changing this formula.
 
     .. seealso::
 
-        :func:`duration`
+        * :func:`lapse_rate`
 
     """
-    return max(0.1 - 0.02 * duration(t), 0.02)
+    dur = np.arange(model_point_table["policy_term"].max() + 1)
+    return np.maximum(0.1 - 0.02 * dur, 0.02)
 
 
 def loading_prem():
@@ -492,25 +683,90 @@ def model_point():
 def mort_rate(t):
     """Mortality rate to be applied at time t
 
+    Looks up :func:`mort_table_array` by the row for :func:`age(t)<age>`
+    and the column for :func:`duration(t)<duration>` capped at 5.
+    Ages outside :attr:`mort_table`, such as the ages of
+    future new business before issue, are capped at the first and
+    the last ages in the table.
+
     .. seealso::
 
        * :attr:`mort_table`
+       * :func:`mort_table_array`
        * :func:`mort_rate_mth`
 
     """
-    return mort_table[str(max(min(5, duration(t)),0))][age(t)]
+    age_idx = age(t) - mort_table.index[0]
+    return mort_table_array()[max(min(len(mort_table.index) - 1, age_idx), 0),
+                              max(min(5, duration(t)), 0)]
 
 
 def mort_rate_mth(t):
     """Monthly mortality rate to be applied at time t
 
+    The monthly rate converted from :func:`mort_rate(t)<mort_rate>` as::
+
+        1-(1- mort_rate(t))**(1/12)
+
+    The rate is picked up from :func:`mort_table_mth_array`,
+    in which all the rates in :attr:`mort_table` are converted in advance.
+    Ages outside :attr:`mort_table` are capped as in :func:`mort_rate`.
+
+    .. seealso::
+
+       * :attr:`mort_table`
+       * :func:`mort_rate`
+       * :func:`mort_table_mth_array`
+
+    """
+    age_idx = age(t) - mort_table.index[0]
+    return mort_table_mth_array()[
+        max(min(len(mort_table.index) - 1, age_idx), 0),
+        max(min(5, duration(t)), 0)]
+
+
+def mort_table_array():
+    """Mortality table as a 2-D Numpy array
+
+    The values of :attr:`mort_table` as a float array.
+    The rows are by age starting from the first age in :attr:`mort_table`,
+    and the columns are by duration from 0 to 5.
+    Rates are picked up from the array by positional indexing,
+    instead of looking up :attr:`mort_table` by labels.
+
     .. seealso::
 
        * :attr:`mort_table`
        * :func:`mort_rate`
+       * :func:`timeline`
+
+    """
+    return mort_table.to_numpy(dtype=np.float64)
+
+
+def mort_table_mth_array():
+    """Monthly mortality table as a 2-D Numpy array
+
+    The annual rates in :func:`mort_table_array` converted to
+    the monthly rates at once as::
+
+        1 - (1 - mort_table_array())**(1/12)
+
+    The conversion is calculated as
+    ``-np.expm1(np.log1p(-mort_table_array())/12)``,
+    which is more accurate than the power for small rates.
+    The shape and the positions of the rates are the same as
+    :func:`mort_table_array`.
+
+    .. seealso::
+
+       * :func:`mort_table_array`
+       * :func:`mort_rate_mth`
+       * :func:`timeline`
 
     """
-    return 1-(1- mort_rate(t))**(1/12)
+    with np.errstate(divide="ignore"):  # log1p(-1) for the rates of 1
+        return -np.expm1(np.log1p(-mort_table_array()) / 12)
 
 
 def net_cf(t):
@@ -528,7 +784,10 @@ def net_cf(t):
         * :func:`commissions`
 
     """
-    return premiums(t) - claims(t) - expenses(t) - commissions(t)
+    if 0 <= t < proj_len():
+        return cf_vectors()["net_cf"][t]
+    else:
+        return 0
 
 
 def net_premium_pp():
@@ -552,6 +811,17 @@ def net_premium_pp():
     return pv_claims() / pv_pols_if()
 
 
+def policy_count():
+    """The number of policies of the selected model point
+
+    The element labeled ``policy_count`` of the Series returned by
+    :func:`model_point`.
+    Read into :func:`pols_if_init` for in-force policies
+    and into :func:`pols_new_biz` for new business.
+    """
+    return model_point()["policy_count"]
+
+
 def policy_term():
     """The policy term of the selected model point.
 
@@ -564,7 +834,10 @@ def policy_term():
 
 def pols_death(t):
     """Number of death occurring at time t"""
-    return pols_if_at(t, "BEF_DECR") * mort_rate_mth(t)
+    if 0 <= t < proj_len():
+        return pols_vectors()["pols_death"][t]
+    else:
+        return 0
 
 
 def pols_if(t):
@@ -577,7 +850,7 @@ def pols_if(t):
         * :func:`pols_if_at`
 
     """
-    return pols_if_at(t, "BEF_MAT")
+    return pols_if_at(t, BEF_MAT)
 
 
 def pols_if_at(t, timing):
@@ -589,6 +862,10 @@ def pols_if_at(t, timing):
     indicate the timing of in-force,
     which is either
     ``"BEF_MAT"``, ``"BEF_NB"`` or ``"BEF_DECR"``.
+    ``timing`` also takes the integer code of the timing,
+    :attr:`BEF_MAT`, :attr:`BEF_NB` or :attr:`BEF_DECR`,
+    which is the row of the timing in
+    the ``"pols_if_at"`` array of :func:`pols_vectors`.
 
     .. rubric:: BEF_MAT
 
@@ -619,25 +896,19 @@ def pols_if_at(t, timing):
         * :func:`pols_maturity`
         * :func:`pols_new_biz`
         * :func:`pols_if`
+        * :func:`pols_vectors`
 
     """
-    if timing == "BEF_MAT":
-
-        if t == 0:
-            return pols_if_init()
-        else:
-            return pols_if_at(t-1, "BEF_DECR") - pols_lapse(t-1) - pols_death(t-1)
-
-    elif timing == "BEF_NB":
-
-        return pols_if_at(t, "BEF_MAT") - pols_maturity(t)
-
-    elif timing == "BEF_DECR":
+    codes = {"BEF_MAT": BEF_MAT, "BEF_NB": BEF_NB, "BEF_DECR": BEF_DECR}
+    code = codes.get(timing, timing)
 
-        return pols_if_at(t, "BEF_NB") + pols_new_biz(t)
+    if code not in codes.values():
+        raise ValueError("invalid timing")
 
+    if 0 <= t < proj_len():
+        return pols_vectors()["pols_if_at"][code, t]
     else:
-        raise ValueError("invalid timing")
+        return 0
 
 
 def pols_if_init(): 
@@ -647,7 +918,7 @@ def pols_if_init():
     :func:`pols_if_at(0, "BEF_MAT")<pols_if_at>`.
     """
     if duration_mth(0) > 0:
-        return model_point()["policy_count"]
+        return policy_count()
     else:
         return 0
 
@@ -660,7 +931,10 @@ def pols_lapse(t):
         * :func:`lapse_rate`
 
     """
-    return pols_if_at(t, "BEF_DECR") * (1-(1 - lapse_rate(t))**(1/12))
+    if 0 <= t < proj_len():
+        return pols_vectors()["pols_lapse"][t]
+    else:
+        return 0
 
 
 def pols_maturity(t):
@@ -672,8 +946,8 @@ def pols_maturity(t):
 
     otherwise ``0``.
     """
-    if duration_mth(t) == policy_term() * 12:
-        return pols_if_at(t, "BEF_MAT")
+    if 0 <= t < proj_len():
+        return pols_vectors()["pols_maturity"][t]
     else:
         return 0
 
@@ -692,14 +966,165 @@ def pols_new_biz(t):
 
     .. seealso::
         * :func:`model_point`
+        * :func:`policy_count`
 
     """
     if duration_mth(t) == 0:
-        return model_point()['policy_count']
+        return policy_count()
     else:
         return 0
 
 
+def pols_vectors():
+    """Policy decrement vectors of the selected model point
+
+    Returns a dict of 1-D Numpy arrays of length :func:`proj_len`.
+    Each array holds the values from time 0 to :func:`proj_len` - 1
+    of the Cells indicated by its key,
+    and the Cells read their values at ``t`` from the arrays.
+    The Cells, including :func:`pols_if_at`, return 0
+    for ``t`` outside the projection,
+    i.e. for negative ``t`` and ``t`` of :func:`proj_len` or greater.
+    The keys are ``"pols_maturity"``, ``"pols_new_biz"``,
+    ``"pols_death"``, ``"pols_lapse"`` and ``"pols_if_at"``.
+    The value for ``"pols_if_at"`` is a 2-D array,
+    whose rows are the numbers of policies in-force at
+    the timings :attr:`BEF_MAT`, :attr:`BEF_NB` and :attr:`BEF_DECR`
+    taken by :func:`pols_if_at`.
+
+    The number of policies in-force before maturity
+    depends on its value at ``t-1``, so it is rolled forward
+    by a single loop from ``t=0``, using the monthly decrement rates
+    in :func:`timeline`.
+    The other arrays are calculated from it after the loop.
+
+    .. seealso::
+
+        * :func:`pols_if_at`
+        * :func:`pols_maturity`
+        * :func:`pols_death`
+        * :func:`pols_lapse`
+        * :func:`timeline`
+
+    """
+    n = proj_len()
+    tl = timeline()
+    mort_mth = tl["mort_rate_mth"]
+    lapse_mth = tl["lapse_rate_mth"]
+
+    new_biz = np.where(tl["duration_mth"] == 0, policy_count(), 0)
+    is_mat = tl["duration_mth"] == policy_term() * 12
+
+    bef_mat = np.empty(n)
+    maturity = np.zeros(n)
+    pols = pols_if_init()
+    for t in range(n):
+        bef_mat[t] = pols
+        if is_mat[t]:
+            maturity[t] = pols
+        bef_decr = pols - maturity[t] + new_biz[t]
+        pols = bef_decr - bef_decr * lapse_mth[t] - bef_decr * mort_mth[t]
+
+    bef_nb = bef_mat - maturity
+    bef_decr = bef_nb + new_biz
+
+    return {
+        "pols_if_at": np.array([bef_mat, bef_nb, bef_decr]),
+        "pols_maturity": maturity,
+        "pols_new_biz": new_biz,
+        "pols_death": bef_decr * mort_mth,
+        "pols_lapse": bef_decr * lapse_mth
+    }
+
+
+def portfolio_vectors():
+    """Projection vectors of all the model points
+
+    Returns a dict of Numpy arrays used by
+    :func:`result_pv_portfolio` and :func:`result_pv_scenarios`
+    to project all the model points in :attr:`model_point_table` at once.
+    The 2-D arrays have rows by model point in the order of
+    :attr:`model_point_table` and columns by ``t`` from 0 to
+    the longest :func:`proj_len` minus 1.
+    The keys are:
+
+    * ``"t"``: 1-D array of ``t``
+    * ``"proj_len"``: 1-D array of :func:`proj_len`
+    * ``"policy_term"``: 1-D array of :func:`policy_term`
+    * ``"in_proj"``: Whether ``t`` is within the projection length
+      of each model point
+    * ``"duration"``: :func:`duration`
+    * ``"mort_rate"``: :func:`mort_rate`
+    * ``"mort_rate_mth"``: :func:`mort_rate_mth`
+    * ``"lapse_rate_mth"``: The monthly lapse rate converted from
+      :func:`lapse_rate_array`
+    * ``"pols_new_biz"``: :func:`pols_new_biz`, 0 after the projection length
+    * ``"is_maturity"``: Whether the policies mature at ``t``
+    * ``"pols_if_init"``: 1-D array of :func:`pols_if_init`
+    * ``"premium_pp"``: 1-D array of :func:`premium_pp`
+    * ``"sum_assured"``: 1-D array of :func:`sum_assured`
+
+    The 2-D arrays of rates and ``"pols_new_biz"`` are in float32
+    to halve the memory traffic on the large arrays.
+    The rates have far fewer significant digits than float32 holds,
+    and the numbers of new policies are exact in float32.
+
+    .. seealso::
+
+       * :func:`result_pv_portfolio`
+       * :func:`result_pv_scenarios`
+
+    """
+    mp = model_point_table
+    entry_age = mp["age_at_entry"].to_numpy()
+    term = mp["policy_term"].to_numpy()
+    count = mp["policy_count"].to_numpy()
+    sum_assd = mp["sum_assured"].to_numpy()
+    dur_mth0 = mp["duration_mth"].to_numpy()
+
+    proj_lens = np.maximum(12 * term - dur_mth0 + 1, 0)
+    t = np.arange(proj_lens.max())
+    in_proj = t < proj_lens[:, None]
+
+    dur_mth = dur_mth0[:, None] + t
+    dur = dur_mth // 12
+
+    # Ages outside the table are capped as in mort_rate
+    age_idx = np.clip(entry_age[:, None] + dur - mort_table.index[0],
+                      0, len(mort_table.index) - 1)
+    dur_idx = np.clip(dur, 0, 5)
+
+    ages, terms = premium_table.index.levels
+    age_pos = ages.get_indexer(entry_age)
+    term_pos = terms.get_indexer(term)
+    if (age_pos < 0).any() or (term_pos < 0).any():
+        raise KeyError("age_at_entry or policy_term not in premium_table")
+
+    prem_pp = np.around(
+        sum_assd * premium_table_array()[age_pos, term_pos], 2)
+
+    lapse_mth = -np.expm1(np.log1p(-lapse_rate_array()) / 12)
+
+    return {
+        "t": t,
+        "proj_len": proj_lens,
+        "policy_term": term,
+        "in_proj": in_proj,
+        "duration": dur,
+        "mort_rate": mort_table_array()[age_idx, dur_idx].astype(np.float32),
+        "mort_rate_mth": mort_table_mth_array()[
+            age_idx, dur_idx].astype(np.float32),
+        "lapse_rate_mth": lapse_mth[
+            np.clip(dur, 0, len(lapse_mth) - 1)].astype(np.float32),
+        "pols_new_biz": np.where(
+            (dur_mth == 0) & in_proj, count[:, None], 0).astype(np.float32),
+        "is_maturity": dur_mth == 12 * term[:, None],
+        "pols_if_init": np.where(dur_mth0 > 0, count, 0).astype(np.float64),
+        "premium_pp": prem_pp,
+        "sum_assured": sum_assd
+    }
+
+
 def premium_pp():
     """Monthly premium per policy
 
@@ -707,16 +1132,118 @@ def premium_pp():
 
         round(sum_assured() * premium_table[age_at_entry(), policy_term()], 2)
 
+    The premium rate is picked up from :func:`premium_table_array`
+    by the positions of :func:`age_at_entry` and :func:`policy_term`
+    in the index levels of :attr:`premium_table`.
+
     .. seealso::
 
         * :attr:`premium_table`
+        * :func:`premium_table_array`
         * :func:`sum_assured`
         * :func:`age_at_entry`
         * :func:`policy_term`
 
 
     """
-    return round(sum_assured() * premium_table[age_at_entry(), policy_term()], 2)
+    ages, terms = premium_table.index.levels
+    rate = premium_table_array()[ages.get_loc(age_at_entry()),
+                                 terms.get_loc(policy_term())]
+    return round(sum_assured() * rate, 2)
+
+
+def premium_table_array():
+    """Premium rate table as a 2-D Numpy array
+
+    The values of :attr:`premium_table` rearranged into a float array
+    whose rows are by entry age and columns are by policy term,
+    in the order of the levels of the MultiIndex of :attr:`premium_table`.
+    Elements for combinations missing in :attr:`premium_table`
+    are ``nan``.
+
+    .. seealso::
+
+        * :attr:`premium_table`
+        * :func:`premium_pp`
+
+    """
+    mi = premium_table.index
+    result = np.full(mi.levshape, np.nan)
+    result[tuple(mi.codes)] = premium_table.to_numpy(dtype=np.float64)
+    return result
+
+
+def present_values():
+    """Present values of the selected model point
+
+    Returns a dict of the present values of the cashflows
+    and the number of policies in-force.
+    The keys are ``"premiums"``, ``"claims"``, ``"expenses"``,
+    ``"commissions"``, ``"net_cf"`` and ``"pols_if"``,
+    and the Cells whose names are the keys prefixed with ``pv_``
+    read their values from the dict.
+
+    The arrays in :func:`cf_vectors` and the in-force before maturity
+    in :func:`pols_vectors` are stacked into a 2-D array,
+    and discounted by a single product with :func:`disc_factors`.
+
+    If :attr:`pv_cache_dir` is set, the dict is also saved in
+    the directory as a file named after a hash of
+    :func:`model_point` and :func:`assumptions_hash`.
+    The dict is read from the file
+    when a file with the same hash exists,
+    so the present values are not recalculated across sessions
+    as long as the model point and the assumptions are the same.
+    The file is written to a temporary file in the directory first
+    and then renamed, so that sessions sharing the directory
+    never read a partially written file.
+    Changes to the other formulas, such as :func:`lapse_rate`,
+    are not reflected in the hash, so the files in the directory
+    should be deleted after changing them.
+
+    .. seealso::
+
+        * :func:`cf_vectors`
+        * :func:`pols_vectors`
+        * :func:`disc_factors`
+        * :attr:`pv_cache_dir`
+        * :func:`assumptions_hash`
+
+    """
+    if pv_cache_dir is not None:
+        import hashlib
+        import os
+        import tempfile
+        import joblib
+
+        key = hashlib.md5(repr(
+            (assumptions_hash(), tuple(model_point().items()))).encode())
+        path = os.path.join(pv_cache_dir, key.hexdigest() + ".pkl")
+
+        if os.path.exists(path):
+            return joblib.load(path)
+
+    keys = ["premiums", "claims", "expenses", "commissions", "net_cf"]
+    cfs = cf_vectors()
+    vectors = np.array([cfs[k] for k in keys]
+                       + [pols_vectors()["pols_if_at"][BEF_MAT]])
+
+    result = dict(zip(keys + ["pols_if"], (vectors @ disc_factors()).tolist()))
+
+    if pv_cache_dir is not None:
+        # Written to a temporary file first, so that a file
+        # at path is always complete when another session reads it
+        os.makedirs(pv_cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=pv_cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                joblib.dump(result, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    return result
 
 
 def premiums(t):
@@ -732,7 +1259,10 @@ def premiums(t):
         * :func:`pols_if_at`
 
     """
-    return premium_pp() * pols_if_at(t, "BEF_DECR")
+    if 0 <= t < proj_len():
+        return cf_vectors()["premiums"][t]
+    else:
+        return 0
 
 
 def proj_len():
@@ -743,6 +1273,10 @@ def proj_len():
 
         12 * policy_term() - duration_mth(0) + 1
 
+    As with the other Cells, the value is calculated
+    only once after :attr:`point_id` is set, and is read from
+    the cache by all the Cells calling :func:`proj_len`.
+
     .. seealso::
 
         :func:`policy_term`
@@ -759,7 +1293,7 @@ def pv_claims():
         * :func:`claims`
 
     """
-    return sum(list(claims(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    return present_values()["claims"]
 
 
 def pv_commissions():
@@ -770,7 +1304,7 @@ def pv_commissions():
         * :func:`expenses`
 
     """
-    return sum(list(commissions(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    return present_values()["commissions"]
 
 
 def pv_expenses():
@@ -781,7 +1315,7 @@ def pv_expenses():
         * :func:`expenses`
 
     """
-    return sum(list(expenses(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    return present_values()["expenses"]
 
 
 def pv_net_cf():
@@ -813,7 +1347,7 @@ def pv_pols_if():
     It is used as the annuity factor for calculating :func:`net_premium_pp`.
 
     """
-    return sum(list(pols_if(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    return present_values()["pols_if"]
 
 
 def pv_premiums():
@@ -824,12 +1358,15 @@ def pv_premiums():
         * :func:`premiums`
 
     """
-    return sum(list(premiums(t) for t in range(proj_len())) * disc_factors()[:proj_len()])
+    return present_values()["premiums"]
 
 
 def result_cf():
     """Result table of cashflows
 
+    The columns are built from the arrays in :func:`cf_vectors`,
+    which hold the values of the cashflow Cells for all ``t``.
+
     .. seealso::
 
        * :func:`premiums`
@@ -837,24 +1374,27 @@ def result_cf():
        * :func:`expenses`
        * :func:`commissions`
        * :func:`net_cf`
+       * :func:`cf_vectors`
 
     """
-
-    t_len = range(proj_len())
+    cfs = cf_vectors()
 
     data = {
-        "Premiums": [premiums(t) for t in t_len],
-        "Claims": [claims(t) for t in t_len],
-        "Expenses": [expenses(t) for t in t_len],
-        "Commissions": [commissions(t) for t in t_len],
-        "Net Cashflow": [net_cf(t) for t in t_len]
+        "Premiums": cfs["premiums"],
+        "Claims": cfs["claims"],
+        "Expenses": cfs["expenses"],
+        "Commissions": cfs["commissions"],
+        "Net Cashflow": cfs["net_cf"]
     }
-    return pd.DataFrame.from_dict(data)
+    return pd.DataFrame(data)
 
 
 def result_pols():
     """Result table of policy decrement
 
+    The columns are built from the arrays in :func:`pols_vectors`,
+    which hold the values of the policy decrement Cells for all ``t``.
+
     .. seealso::
 
        * :func:`pols_if`
@@ -862,20 +1402,20 @@ def result_pols():
        * :func:`pols_new_biz`
        * :func:`pols_death`
        * :func:`pols_lapse`
+       * :func:`pols_vectors`
 
     """
-
-    t_len = range(proj_len())
+    pols = pols_vectors()
 
     data = {
-        "pols_if": [pols_if(t) for t in t_len],
-        "pols_maturity": [pols_maturity(t) for t in t_len],
-        "pols_new_biz": [pols_new_biz(t) for t in t_len],
-        "pols_death": [pols_death(t) for t in t_len],
-        "pols_lapse": [pols_lapse(t) for t in t_len]
+        "pols_if": pols["pols_if_at"][BEF_MAT],
+        "pols_maturity": pols["pols_maturity"],
+        "pols_new_biz": pols["pols_new_biz"],
+        "pols_death": pols["pols_death"],
+        "pols_lapse": pols["pols_lapse"]
     }
 
-    return pd.DataFrame.from_dict(data)
+    return pd.DataFrame(data)
 
 
 def result_pv():
@@ -900,6 +1440,212 @@ def result_pv():
             orient='index')
 
 
+def result_pv_portfolio():
+    """Result table of present value of cashflows for all model points
+
+    Returns a DataFrame of the present values of the cashflows
+    for all the model points in :attr:`model_point_table`.
+    The DataFrame is indexed by ``point_id``, and its columns
+    are the same as the columns of :func:`result_pv`.
+
+    The projections for all the model points are carried out
+    independently of :attr:`point_id`, on the 2-D Numpy arrays
+    in :func:`portfolio_vectors`
+    whose rows are model points and whose columns are ``t``.
+    The model points are grouped by policy term, and
+    the projection for each group is carried out at once
+    on the rows of the group, up to the latest maturity in the group.
+    The policies mature at the last step of :func:`proj_len`,
+    so the number of policies is rolled forward without
+    checking maturity at each step, and set to 0 from the maturity.
+    The number of policies is rolled forward by a single loop over ``t``
+    operating on all the model points in the group at each step.
+    The formulas are the same as the ones for the selected model point,
+    such as :func:`pols_vectors` and :func:`cf_vectors`.
+
+    The 2-D arrays of the numbers of policies and the cashflows
+    are held in float32, while the numbers of policies are
+    rolled forward and the discounted cashflows are summed in float64.
+    The present values agree with :func:`result_pv` to about
+    7 significant digits.
+
+    Example:
+        The PVs of the selected model point are
+        close to those in :func:`result_pv`::
+
+            >>> Projection.result_pv_portfolio().loc[Projection.point_id]
+            Premiums        708379.113281
+            Claims          474803.306641
+            Expenses         38902.884247
+            Commissions      85874.883789
+            Net Cashflow    108798.038605
+            Name: 1, dtype: float64
+
+    .. seealso::
+
+       * :func:`result_pv`
+       * :func:`portfolio_vectors`
+       * :attr:`model_point_table`
+
+    """
+    pv = portfolio_vectors()
+    t = pv["t"]
+    term = pv["policy_term"]
+
+    # Policies mature at the last step of the projection,
+    # so no policies are in-force from the step onwards
+    mat_t = pv["proj_len"] - 1
+
+    infl = inflation_factor_array()[t//12].astype(np.float32)
+    disc_rate = np.expm1(np.log1p(disc_rate_ann_array()[t//12]) / 12)
+    disc = ((1 + disc_rate)**(-t)).astype(np.float32)
+    prem_pp = pv["premium_pp"].astype(np.float32)
+    sum_assd = pv["sum_assured"].astype(np.float32)
+
+    keys = ["Premiums", "Claims", "Expenses", "Commissions"]
+    pvs = {k: np.zeros(len(term)) for k in keys}
+
+    for n in np.unique(term):
+        rows = np.flatnonzero(term == n)
+        t_len = max(mat_t[rows].max(), 0)
+
+        mort_mth = pv["mort_rate_mth"][rows, :t_len]
+        lapse_mth = pv["lapse_rate_mth"][rows, :t_len]
+        new_biz = pv["pols_new_biz"][rows, :t_len]
+
+        # The policies are rolled forward in float64 and stored in float32
+        bef_decr = np.zeros((len(rows), t_len), dtype=np.float32)
+        pols = pv["pols_if_init"][rows]
+
+        for i in range(t_len):
+            pols = pols + new_biz[:, i]
+            bef_decr[:, i] = pols
+            pols = pols - pols * lapse_mth[:, i] - pols * mort_mth[:, i]
+
+        bef_decr[t[:t_len] >= mat_t[rows, None]] = 0
+
+        prems = prem_pp[rows, None] * bef_decr
+        cfs = [
+            prems,
+            sum_assd[rows, None] * bef_decr * mort_mth,
+            expense_acq() * new_biz
+            + bef_decr * expense_maint()/12 * infl[:t_len],
+            np.where(pv["duration"][rows, :t_len] == 0, prems, 0)
+        ]
+
+        # Discounted cashflows are summed in float64
+        for k, cf in zip(keys, cfs):
+            pvs[k][rows] = (cf * disc[:t_len]).sum(axis=1, dtype=np.float64)
+
+    pvs["Net Cashflow"] = pvs["Premiums"] - pvs["Claims"] \
+        - pvs["Expenses"] - pvs["Commissions"]
+
+    return pd.DataFrame(pvs, index=model_point_table.index)
+
+
+def result_pv_scenarios(mort_factors, disc_shifts):
+    """Result table of present value of cashflows under stress scenarios
+
+    Returns a DataFrame of the present values of the cashflows
+    for all the model points in :attr:`model_point_table`
+    under multiple stress scenarios.
+    ``mort_factors`` and ``disc_shifts`` are tuples of the same length,
+    and their ``i``-th elements define the scenario ``i``:
+    the annual mortality rates are multiplied by ``mort_factors[i]``
+    capped at 1, and ``disc_shifts[i]`` is added to
+    the annual discount rates in :attr:`disc_rate_ann`.
+    The premiums are not changed by the scenarios.
+    The DataFrame is indexed by the scenario number and the index of
+    :attr:`model_point_table`,
+    and its columns are the same as the columns of :func:`result_pv`.
+
+    The calculation is carried out by `JAX`_, which needs to be installed.
+    The roll-forward over ``t`` is carried out by ``jax.lax.scan``
+    on the arrays in :func:`portfolio_vectors`,
+    and the present values are accumulated at each step,
+    so no cashflow arrays are kept for the scenarios.
+    The scenarios are vectorized by ``jax.vmap``,
+    and the whole calculation is compiled by ``jax.jit``.
+    The values are calculated in JAX's default precision,
+    which is float32 unless 64-bit mode is enabled in JAX.
+
+    Example:
+        The base scenario, 10% higher mortality and
+        1% higher discount rates::
+
+            >>> df = Projection.result_pv_scenarios((1, 1.1, 1), (0, 0, 0.01))
+
+            >>> df.xs(1, level="policy_id")
+                         Premiums        Claims      Expenses   Commissions   Net Cashflow
+            scenario
+            0         708379.3750  474803.46875  38902.910156  85874.890625  108798.105469
+            1         708046.5625  522009.34375  38884.218750  85872.554688   61280.445312
+            2         677823.8750  450137.00000  37194.863281  85526.148438  104965.863281
+
+    .. _JAX: https://github.com/jax-ml/jax
+
+    .. seealso::
+
+       * :func:`result_pv_portfolio`
+       * :func:`portfolio_vectors`
+
+    """
+    import jax
+    import jax.numpy as jnp
+
+    pv = portfolio_vectors()
+    t = pv["t"]
+    disc_rate_ann_t = jnp.asarray(disc_rate_ann_array()[t//12])
+    prem_pp = jnp.asarray(pv["premium_pp"])
+    sum_assd = jnp.asarray(pv["sum_assured"])
+    acq = expense_acq()
+    maint = expense_maint()/12 * inflation_factor_array()[t//12]
+
+    # Arrays to scan over t, transposed to (t, model points)
+    xs = tuple(jnp.asarray(x) for x in (
+        pv["mort_rate"].T, pv["lapse_rate_mth"].T, pv["pols_new_biz"].T,
+        pv["is_maturity"].T, pv["duration"].T == 0, pv["in_proj"].T, maint))
+
+    def project(mort_factor, disc_shift):
+
+        disc = (1 + disc_rate_ann_t + disc_shift)**(-jnp.arange(len(t))/12)
+
+        def step(carry, x):
+            pols, pvs = carry
+            mort, lapse_mth, new_biz, is_mat, first_yr, in_proj, maint_t, disc_t = x
+
+            # Written with expm1 and log1p to keep precision in float32
+            mort_mth = -jnp.expm1(jnp.log1p(-jnp.minimum(mort * mort_factor, 1))/12)
+            bef_decr = jnp.where(in_proj, jnp.where(is_mat, 0, pols) + new_biz, 0)
+            prems = prem_pp * bef_decr
+            cfs = jnp.stack([
+                prems,
+                sum_assd * bef_decr * mort_mth,
+                acq * new_biz * in_proj + bef_decr * maint_t,
+                jnp.where(first_yr, prems, 0)])
+
+            pols = bef_decr - bef_decr * lapse_mth - bef_decr * mort_mth
+            return (pols, pvs + cfs * disc_t), None
+
+        init = (jnp.asarray(pv["pols_if_init"]), jnp.zeros((4, len(prem_pp))))
+        (_, pvs), _ = jax.lax.scan(step, init, xs + (disc,))
+        return pvs
+
+    pvs = np.asarray(jax.jit(jax.vmap(project))(
+        jnp.asarray(mort_factors), jnp.asarray(disc_shifts)), dtype=np.float64)
+
+    index = pd.MultiIndex.from_product(
+        [range(len(mort_factors)), model_point_table.index],
+        names=["scenario", model_point_table.index.name])
+    cols = ["Premiums", "Claims", "Expenses", "Commissions"]
+    result = pd.DataFrame(
+        {c: pvs[:, i, :].ravel() for i, c in enumerate(cols)}, index=index)
+    result["Net Cashflow"] = result["Premiums"] - result["Claims"] \
+        - result["Expenses"] - result["Commissions"]
+
+    return result
+
+
 def sex(): 
     """The sex of the selected model point
 
@@ -921,9 +1667,69 @@ def sum_assured():
     return model_point()["sum_assured"]
 
 
+def timeline():
+    """Time-dependent vectors of the selected model point
+
+    Returns a dict of 1-D Numpy arrays of length :func:`proj_len`.
+    Each array holds the values from time 0 to :func:`proj_len` - 1
+    of the item indicated by its key.
+    The keys are ``"duration_mth"``, ``"duration"``,
+    ``"mort_rate_mth"``, ``"lapse_rate"``, ``"lapse_rate_mth"``
+    and ``"inflation_factor"``.
+    ``"lapse_rate"`` holds the values of :func:`lapse_rate`
+    picked up from :func:`lapse_rate_array` by the array of durations.
+    ``"lapse_rate_mth"`` is the monthly lapse rate converted
+    from :func:`lapse_rate` as ``-np.expm1(np.log1p(-lapse_rate)/12)``,
+    which equals ``1 - (1 - lapse_rate)**(1/12)``.
+    ``"inflation_factor"`` holds the values of :func:`inflation_factor`.
+    The factors change only every 12 months, so the yearly factors in
+    :func:`inflation_factor_array` are repeated for the months in the year.
+
+    The values are calculated for all ``t`` at once
+    by Numpy operations on the arrays.
+
+    .. seealso::
+
+        * :func:`duration_mth`
+        * :func:`duration`
+        * :func:`mort_rate_mth`
+        * :func:`lapse_rate`
+        * :func:`lapse_rate_array`
+        * :func:`inflation_factor`
+        * :func:`inflation_factor_array`
+        * :func:`pols_vectors`
+
+    """
+    dur_mth = duration_mth(0) + np.arange(proj_len())
+    dur = dur_mth // 12
+
+    # Ages outside the table are capped as in mort_rate
+    age_idx = np.clip(age_at_entry() + dur - mort_table.index[0],
+                      0, len(mort_table.index) - 1)
+
+    lapse_rate_arr = lapse_rate_array()[
+        np.clip(dur, 0, len(lapse_rate_array()) - 1)]
+
+    return {
+        "duration_mth": dur_mth,
+        "duration": dur,
+        "mort_rate_mth": mort_table_mth_array()[age_idx, np.clip(dur, 0, 5)],
+        "lapse_rate": lapse_rate_arr,
+        "lapse_rate_mth": -np.expm1(np.log1p(-lapse_rate_arr) / 12),
+        "inflation_factor": np.repeat(
+            inflation_factor_array()[:proj_len()//12 + 1], 12)[:proj_len()]
+    }
+
+
 # ---------------------------------------------------------------------------
 # References
 
+BEF_DECR = 2
+
+BEF_MAT = 0
+
+BEF_NB = 1
+
 disc_rate_ann = ("DataClient", 2160330731208)
 
 model_point_table = ("DataClient", 2160335976392)
@@ -936,4 +1742,6 @@ pd = ("Module", "pandas")
 
 point_id = 1
 
-premium_table = ("DataClient", 2160336367816)
\ No newline at end of file
+premium_table = ("DataClient", 2160336367816)
+
+pv_cache_dir = None
\ No newline at end of file
@@ -50,7 +50,7 @@ def test_main(argv, tmp_path):
          ("BasicTerm_SE", "Projection", (1,), "pv_net_cf", ()),
          None,
          None,
-         108798.06191624879],
+         pytest.approx(108798.06191624879, rel=1e-12)],
 
         ["basiclife",
          "BasicTerm_ME",
@@ -64,7 +64,7 @@ def test_main(argv, tmp_path):
          ("BasicTerm_S", "Projection", (1,), "pv_net_cf", ()),
          None,
          None,
-         912.9517309878909],
+         pytest.approx(912.9517309878909, rel=1e-12)],
 
         ["basiclife",
          "BasicTerm_M",